@@ -1,8 +1,8 @@
 from typing import TypeVar, Generic
 from balQt.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsProxyWidget, QWidget, QSizePolicy
 from balQt.QtCore import QSize, Qt
-from balQt.tools import (combine_size_policies, get_policies, get_dimensions, get_rotated_dimensions,
-                         get_original_dimensions, get_quadrant_or_axis, QuadrantOrAxis, abs_sin_d, abs_cos_d)
+from balQt.tools import (combine_size_policies, get_policies, get_dimensions, specialize_original_dimensions,
+                         get_quadrant_or_axis, QuadrantOrAxis, get_trig_values)
 
 # Type variable for generic widget type
 T = TypeVar('T', bound=QWidget)
@@ -20,6 +20,12 @@ class RotatedWidget(QGraphicsView, Generic[T]):
         proxy (QGraphicsProxyWidget): The proxy that applies the rotation to the widget.
     """
 
+    # The Qt wrapper base still provides a __dict__, but keeping our own attributes in slots leaves it
+    # empty and makes their reads slot lookups
+    __slots__ = ('widget', '_angle', 'preserve_aspect_ratio', 'scene', 'proxy', '_dim_cache_key', '_dim_cache_val',
+                 '_size_hint_cache_key', '_size_hint_cache_val', '_compute_original',
+                 '_cos', '_sin', '_quadrant', '_is_mod90', '_is_mod180')
+
     def __init__(self, widget: T, angle: float = 270, parent: QWidget = None, preserve_aspect_ratio: bool = False):
         """
         Initialize the rotated widget.
@@ -31,6 +37,11 @@ class RotatedWidget(QGraphicsView, Generic[T]):
             preserve_aspect_ratio (bool, optional): To preserve aspect ratio. Defaults to False.
         """
         super().__init__(parent)
+        self._dim_cache_key = None
+        self._dim_cache_val = None
+        self._size_hint_cache_key = None
+        self._size_hint_cache_val = None
+        self.proxy = None
         self.widget = widget
         self.angle = angle
         self.preserve_aspect_ratio = preserve_aspect_ratio
@@ -53,36 +64,116 @@ class RotatedWidget(QGraphicsView, Generic[T]):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
+    @property
+    def angle(self) -> float:
+        """The rotation angle in degrees."""
+        return self._angle
+
+    @angle.setter
+    def angle(self, angle: float):
+        self._angle = angle
+        self._set_angle_cache()
+        # Re-apply the rotation once the proxy exists (the initializer applies it itself)
+        if self.proxy is not None:
+            self.proxy.setTransformOriginPoint(self.widget.width() / 2, self.widget.height() / 2)
+            self.proxy.setRotation(angle)
+            self.update_size_policy()
+
+    def _set_angle_cache(self):
+        """
+        Precompute the values derived from the angle and pick the computations specialized for it.
+        """
+        angle = self._angle
+        self._cos, self._sin, _ = get_trig_values(angle)
+        self._quadrant = get_quadrant_or_axis(angle)
+        self._is_mod90 = angle % 90 == 0
+        self._is_mod180 = angle % 180 == 0
+        self._compute_original = specialize_original_dimensions(angle)
+        # Cached dimensions depend on the angle, so drop them
+        self._dim_cache_key = None
+        self._size_hint_cache_key = None
+
+    def _rotated_dims(self, width: float, height: float):
+        """
+        Compute the bounding box size of a width by height rectangle rotated by the angle.
+
+        Args:
+            width (float): The width before rotation.
+            height (float): The height before rotation.
+
+        Returns:
+            tuple[float, float]: The rotated width and height.
+        """
+        return width * self._cos + height * self._sin, height * self._cos + width * self._sin
+
     def update_size_policy(self):
         """
         Update the size policy and adjust the widget dimensions based on the rotation angle.
         """
-        rotated_width, rotated_height = get_rotated_dimensions(self.widget.width(), self.widget.height(), self.angle)
-        rotated_width, rotated_height = round(rotated_width), round(rotated_height)
-        horizontal_policy, vertical_policy = get_policies(self.widget.sizePolicy())
-        if self.angle % 180 == 0:
-            self.setSizePolicy(horizontal_policy, vertical_policy)
-            self.setMinimumSize(self.widget.minimumSize())
-            self.setMaximumSize(self.widget.maximumSize())
-            if vertical_policy == QSizePolicy.Fixed:
-                self.setFixedHeight(rotated_height)
-            if horizontal_policy == QSizePolicy.Fixed:
-                self.setFixedWidth(rotated_width)
-        elif self.angle % 90 == 0:
-            self.setSizePolicy(vertical_policy, horizontal_policy)
-            self.setMinimumSize(QSize(self.widget.minimumHeight(), self.widget.minimumWidth()))
-            self.setMaximumSize(QSize(self.widget.maximumHeight(), self.widget.maximumWidth()))
-            if vertical_policy == QSizePolicy.Fixed:
-                self.setFixedWidth(rotated_width)
-            if horizontal_policy == QSizePolicy.Fixed:
-                self.setFixedHeight(rotated_height)
+        if self._is_mod180:
+            self._update_size_policy_mod180()
+        elif self._is_mod90:
+            self._update_size_policy_mod90()
         else:
-            combined_size_policy = combine_size_policies(horizontal_policy, vertical_policy)
-            self.setSizePolicy(combined_size_policy, combined_size_policy)
-            self.setMinimumSize(QSize(*map(round, get_rotated_dimensions(self.widget.minimumWidth(),
-                                                                         self.widget.minimumHeight(), self.angle))))
-            self.setMaximumSize(QSize(*map(round, get_rotated_dimensions(self.widget.maximumWidth(),
-                                                                         self.widget.maximumHeight(), self.angle))))
+            self._update_size_policy_general()
+
+    def _update_size_policy_mod180(self):
+        """
+        Update the size policy and adjust the widget dimensions for angles that are multiples of 180 degrees.
+        """
+        widget = self.widget
+        rotated_width, rotated_height = widget.width(), widget.height()
+        horizontal_policy, vertical_policy = get_policies(widget.sizePolicy())
+        self.setSizePolicy(horizontal_policy, vertical_policy)
+        self.setMinimumSize(widget.minimumSize())
+        self.setMaximumSize(widget.maximumSize())
+        if vertical_policy == QSizePolicy.Fixed:
+            self.setFixedHeight(rotated_height)
+        if horizontal_policy == QSizePolicy.Fixed:
+            self.setFixedWidth(rotated_width)
+        self._apply_rotated_size(rotated_width, rotated_height)
+
+    def _update_size_policy_mod90(self):
+        """
+        Update the size policy and adjust the widget dimensions for odd multiples of 90 degrees.
+        """
+        widget = self.widget
+        rotated_width, rotated_height = widget.height(), widget.width()
+        horizontal_policy, vertical_policy = get_policies(widget.sizePolicy())
+        minimum_size, maximum_size = widget.minimumSize(), widget.maximumSize()
+        self.setSizePolicy(vertical_policy, horizontal_policy)
+        self.setMinimumSize(QSize(minimum_size.height(), minimum_size.width()))
+        self.setMaximumSize(QSize(maximum_size.height(), maximum_size.width()))
+        if vertical_policy == QSizePolicy.Fixed:
+            self.setFixedWidth(rotated_width)
+        if horizontal_policy == QSizePolicy.Fixed:
+            self.setFixedHeight(rotated_height)
+        self._apply_rotated_size(rotated_width, rotated_height)
+
+    def _update_size_policy_general(self):
+        """
+        Update the size policy and adjust the widget dimensions for angles that are not multiples of 90 degrees.
+        """
+        widget = self.widget
+        rotated_width, rotated_height = self._rotated_dims(widget.width(), widget.height())
+        horizontal_policy, vertical_policy = get_policies(widget.sizePolicy())
+        combined_size_policy = combine_size_policies(horizontal_policy, vertical_policy)
+        self.setSizePolicy(combined_size_policy, combined_size_policy)
+        minimum_size, maximum_size = widget.minimumSize(), widget.maximumSize()
+        minimum_width, minimum_height = self._rotated_dims(minimum_size.width(), minimum_size.height())
+        self.setMinimumSize(QSize(round(minimum_width), round(minimum_height)))
+        maximum_width, maximum_height = self._rotated_dims(maximum_size.width(), maximum_size.height())
+        self.setMaximumSize(QSize(round(maximum_width), round(maximum_height)))
+        self._apply_rotated_size(round(rotated_width), round(rotated_height))
+
+    def _apply_rotated_size(self, rotated_width: int, rotated_height: int):
+        """
+        Resize to the rotated dimensions and clamp the size limits according to the resulting size policy.
+
+        Args:
+            rotated_width (int): The rotated width.
+            rotated_height (int): The rotated height.
+        """
         self.setGeometry(0, 0, rotated_width, rotated_height)
         horizontal_policy, vertical_policy = get_policies(self.sizePolicy())
         if horizontal_policy in [QSizePolicy.Minimum, QSizePolicy.MinimumExpanding]:
@@ -99,30 +190,44 @@ class RotatedWidget(QGraphicsView, Generic[T]):
                 self.setMaximumHeight(rotated_height)
 
     def sizeHint(self):
-        rotated_width, rotated_height = get_rotated_dimensions(self.widget.sizeHint().width(),
-                                                               self.widget.sizeHint().height(), self.angle)
-        return QSize(round(rotated_width), round(rotated_height))
-
+        widget_size_hint = self.widget.sizeHint()
+        key = (widget_size_hint.width(), widget_size_hint.height(), self.angle)
+        if key != self._size_hint_cache_key:
+            rotated_width, rotated_height = self._rotated_dims(key[0], key[1])
+            self._size_hint_cache_val = (round(rotated_width), round(rotated_height))
+            self._size_hint_cache_key = key
+        return QSize(*self._size_hint_cache_val)
 
     def get_widget_dimensions(self):
-        horizontal_policy, vertical_policy = get_policies(self.widget.sizePolicy())
-        current_width, current_height = get_dimensions(self.widget, consider_none=not self.preserve_aspect_ratio)
+        widget = self.widget
+        horizontal_policy, vertical_policy = get_policies(widget.sizePolicy())
+        widget_size_hint = widget.sizeHint()
+        size_hint_width, size_hint_height = widget_size_hint.width(), widget_size_hint.height()
+        view_width, view_height = self.width(), self.height()
+        key = (view_width, view_height, widget.width(), widget.height(), size_hint_width, size_hint_height,
+               self.angle, horizontal_policy, vertical_policy, self.preserve_aspect_ratio)
+        if key == self._dim_cache_key:
+            return self._dim_cache_val
+
+        current_width, current_height = get_dimensions(widget, consider_none=not self.preserve_aspect_ratio)
         constant_width = horizontal_policy in [QSizePolicy.Fixed, QSizePolicy.Preferred]
         constant_height = vertical_policy in [QSizePolicy.Fixed, QSizePolicy.Preferred]
         if (constant_height and constant_width) or ((constant_height or constant_width) and self.preserve_aspect_ratio):
-            return current_width, current_height
+            width, height = current_width, current_height
         else:
-            width, height = get_original_dimensions(self.width(), self.height(), self.angle,
-                                                    current_width=current_width, current_height=current_height)
+            width, height = self._compute_original(view_width, view_height, current_width, current_height)
             if horizontal_policy in [QSizePolicy.Minimum, QSizePolicy.MinimumExpanding]:
-                width = max(float(self.widget.sizeHint().width()), width)
+                width = max(float(size_hint_width), width)
             elif horizontal_policy == QSizePolicy.Maximum:
-                width = min(float(self.widget.sizeHint().width()), width)
+                width = min(float(size_hint_width), width)
             if vertical_policy in [QSizePolicy.Minimum, QSizePolicy.MinimumExpanding]:
-                height = max(float(self.widget.sizeHint().height()), height)
+                height = max(float(size_hint_height), height)
             elif vertical_policy == QSizePolicy.Maximum:
-                height = min(float(self.widget.sizeHint().height()), height)
-            return width, height
+                height = min(float(size_hint_height), height)
+
+        self._dim_cache_key = key
+        self._dim_cache_val = width, height
+        return width, height
 
     def resizeEvent(self, event):
         """
@@ -131,12 +236,13 @@ class RotatedWidget(QGraphicsView, Generic[T]):
         Args:
             event: The resize event.
         """
+        cos_angle, sin_angle = self._cos, self._sin
         proxy_rect = self.proxy.geometry()
         scene_rect = self.scene.sceneRect()
 
         # Calculate original and rotated dimensions
         width, height = self.get_widget_dimensions()
-        rotated_width, rotated_height = get_rotated_dimensions(width, height, self.angle)
+        rotated_width, rotated_height = self._rotated_dims(width, height)
 
         # Adjust geometry if necessary
         if abs(self.width() - round(rotated_width)) >= 1 or abs(self.height() - round(rotated_height)) >= 0:
@@ -144,17 +250,17 @@ class RotatedWidget(QGraphicsView, Generic[T]):
             self.setGeometry(geom.left(), geom.top(), round(rotated_width), round(rotated_height))
 
         # Adjust scene rect based on the quadrant or axis
-        quadrant_or_axis = get_quadrant_or_axis(self.angle)
+        quadrant_or_axis = self._quadrant
         if quadrant_or_axis == QuadrantOrAxis.QUADRANT_1:
-            scene_rect.setLeft(scene_rect.left() - (height - proxy_rect.height()) * abs_sin_d(self.angle))
+            scene_rect.setLeft(scene_rect.left() - (height - proxy_rect.height()) * sin_angle)
         elif quadrant_or_axis == QuadrantOrAxis.QUADRANT_2:
             scene_rect.setLeft(scene_rect.left() - (rotated_width - scene_rect.width()))
-            scene_rect.setTop(scene_rect.top() - (height - proxy_rect.height()) * abs_cos_d(self.angle))
+            scene_rect.setTop(scene_rect.top() - (height - proxy_rect.height()) * cos_angle)
         elif quadrant_or_axis == QuadrantOrAxis.QUADRANT_3:
-            scene_rect.setLeft(scene_rect.left() - (width - proxy_rect.width()) * abs_cos_d(self.angle))
+            scene_rect.setLeft(scene_rect.left() - (width - proxy_rect.width()) * cos_angle)
             scene_rect.setTop(scene_rect.top() - (rotated_height - scene_rect.height()))
         elif quadrant_or_axis == QuadrantOrAxis.QUADRANT_4:
-            scene_rect.setTop(scene_rect.top() - (width - proxy_rect.width()) * abs_sin_d(self.angle))
+            scene_rect.setTop(scene_rect.top() - (width - proxy_rect.width()) * sin_angle)
         elif quadrant_or_axis == QuadrantOrAxis.NEGATIVE_X_AXIS:
             scene_rect.setLeft(scene_rect.left() - (rotated_width - scene_rect.width()))
         elif quadrant_or_axis == QuadrantOrAxis.NEGATIVE_Y_AXIS:
@@ -171,15 +277,14 @@ class RotatedWidget(QGraphicsView, Generic[T]):
 
     def __getattr__(self, item):
         """
-        Delegate attribute access to the underlying widget or the QGraphicsView.
+        Delegate attribute access the QGraphicsView cannot resolve to the underlying widget.
 
         Args:
             item (str): Attribute name.
 
         Returns:
-            Any: Attribute value from either the widget or the base class.
+            Any: Attribute value from the widget.
         """
-        if hasattr(super(QGraphicsView, self), item):
-            return super(QGraphicsView, self).__getattribute__(item)
-        else:
-            return self.widget.__getattribute__(item)
+        # Only reached once normal lookup on the view has failed; read the widget without
+        # going through __getattr__ so an unset widget cannot recurse
+        return QGraphicsView.__getattribute__(self, 'widget').__getattribute__(item)
@@ -1,8 +1,38 @@
 from balQt.QtWidgets import QWidget, QSizePolicy
-from typing import Tuple, Optional
+from typing import Callable, Dict, Tuple, Optional
 from enum import Enum
+import functools
 import math
 
+# Ordered list of available policies from least to most flexible
+_POLICY_ORDER = (
+    QSizePolicy.Fixed,
+    QSizePolicy.Minimum,
+    QSizePolicy.MinimumExpanding,
+    QSizePolicy.Maximum,
+    QSizePolicy.Preferred,
+    QSizePolicy.Expanding,
+    QSizePolicy.Ignored
+)
+
+
+def _closest_superior_policy(combined_policy) -> QSizePolicy.Policy:
+    for policy in _POLICY_ORDER:
+        if combined_policy <= policy:
+            return policy
+
+    # Default fallback (should not be reached if all cases are covered)
+    return QSizePolicy.Ignored
+
+
+# Closest superior policy for every possible logical OR of two policies
+_COMBINED_POLICY_TABLE: Dict[int, QSizePolicy.Policy] = {
+    horizontal_policy | vertical_policy: _closest_superior_policy(horizontal_policy | vertical_policy)
+    for horizontal_policy in _POLICY_ORDER
+    for vertical_policy in _POLICY_ORDER
+}
+
+
 def combine_size_policies(horizontal_policy, vertical_policy):
     """
     Combines horizontal and vertical size policies by using logical OR and finding
@@ -15,27 +45,7 @@ def combine_size_policies(horizontal_policy, vertical_policy):
     Returns:
         QSizePolicy.Policy: A single QSizePolicy.Policy representing both.
     """
-    # Perform a logical OR to combine the policies
-    combined_policy = horizontal_policy | vertical_policy
-
-    # Ordered list of available policies from least to most flexible
-    policy_order = [
-        QSizePolicy.Fixed,
-        QSizePolicy.Minimum,
-        QSizePolicy.MinimumExpanding,
-        QSizePolicy.Maximum,
-        QSizePolicy.Preferred,
-        QSizePolicy.Expanding,
-        QSizePolicy.Ignored
-    ]
-
-    # Otherwise, find the closest superior policy
-    for policy in policy_order:
-        if combined_policy <= policy:
-            return policy
-
-    # Default fallback (should not be reached if all cases are covered)
-    return QSizePolicy.Ignored
+    return _COMBINED_POLICY_TABLE[horizontal_policy | vertical_policy]
 
 
 def get_policies(size_policy: QSizePolicy) -> Tuple[QSizePolicy.Policy, QSizePolicy.Policy]:
@@ -70,51 +80,57 @@ class QuadrantOrAxis(Enum):
     QUADRANT_4 = "Quadrant 4 (270° to 360°)"
 
 
+# Quadrants indexed by the number of whole right angles in a normalized angle
+_QUADRANTS = (QuadrantOrAxis.QUADRANT_1, QuadrantOrAxis.QUADRANT_2,
+              QuadrantOrAxis.QUADRANT_3, QuadrantOrAxis.QUADRANT_4)
+
+# Axes keyed by their normalized angle
+_AXES = {
+    0: QuadrantOrAxis.POSITIVE_X_AXIS,
+    90: QuadrantOrAxis.POSITIVE_Y_AXIS,
+    180: QuadrantOrAxis.NEGATIVE_X_AXIS,
+    270: QuadrantOrAxis.NEGATIVE_Y_AXIS
+}
+
+
+@functools.lru_cache(maxsize=512)
 def get_quadrant_or_axis(angle: float) -> QuadrantOrAxis:
     """Determine the quadrant or axis for a given angle in degrees."""
-    normalized_angle = normalize_angle(angle)  # Normalize the angle to [0, 360)
-
-    if normalized_angle == 0:
-        return QuadrantOrAxis.POSITIVE_X_AXIS
-    elif normalized_angle == 90:
-        return QuadrantOrAxis.POSITIVE_Y_AXIS
-    elif normalized_angle == 180:
-        return QuadrantOrAxis.NEGATIVE_X_AXIS
-    elif normalized_angle == 270:
-        return QuadrantOrAxis.NEGATIVE_Y_AXIS
-    elif normalized_angle < 90:
-        return QuadrantOrAxis.QUADRANT_1
-    elif normalized_angle < 180:
-        return QuadrantOrAxis.QUADRANT_2
-    elif normalized_angle < 270:
-        return QuadrantOrAxis.QUADRANT_3
-    else:
-        return QuadrantOrAxis.QUADRANT_4
+    normalized_angle = angle % 360  # Normalize the angle to [0, 360]; tiny negative angles round up to 360
+    axis = _AXES.get(normalized_angle)
+    return axis if axis is not None else _QUADRANTS[min(int(normalized_angle // 90), 3)]
 
+@functools.lru_cache(maxsize=512)
 def normalize_angle(angle: float):
     return angle % 360
 
+@functools.lru_cache(maxsize=512)
 def radians_angle(angle: float, normalize: bool = True):
-    return math.radians(normalize_angle(angle) if normalize else angle)
+    return math.radians(angle % 360 if normalize else angle)
 
 def abs_sin(angle: float):
-    return abs(math.sin(angle))
+    return math.fabs(math.sin(angle))
 
 def abs_cos(angle: float):
-    return abs(math.cos(angle))
+    return math.fabs(math.cos(angle))
 
+@functools.lru_cache(maxsize=512)
 def abs_sin_d(angle: float):
     return abs_sin(radians_angle(angle))
 
+@functools.lru_cache(maxsize=512)
 def abs_cos_d(angle: float):
     return abs_cos(radians_angle(angle))
 
-def get_rotated_dimensions(width: float, height: float, angle: float):
-    angle_rad = radians_angle(angle)
+@functools.lru_cache(maxsize=512)
+def get_trig_values(angle: float) -> Tuple[float, float, float]:
+    """Return the absolute cosine, absolute sine and cosine of twice the angle (in degrees)."""
+    angle_rad = math.radians(angle % 360)
+    return math.fabs(math.cos(angle_rad)), math.fabs(math.sin(angle_rad)), math.cos(2 * angle_rad)
 
+def get_rotated_dimensions(width: float, height: float, angle: float):
     # Reverse rotation matrix elements
-    cos_angle = abs_cos(angle_rad)
-    sin_angle = abs_sin(angle_rad)
+    cos_angle, sin_angle, _ = get_trig_values(angle)
 
     # Calculate rotated bounding box size
     rotated_width = width * cos_angle + height * sin_angle
@@ -123,91 +139,74 @@ def get_rotated_dimensions(width: float, height: float, angle: float):
     return rotated_width, rotated_height
 
 
-def get_original_dimensions(
-        rotated_width: float,
-        rotated_height: float,
-        angle: float,
-        current_width: float = None,
-        current_height: float = None
-) -> tuple[float, float]:
-    """
-    Compute the original width and height of a rectangle before rotation.
-
-    Parameters:
-        rotated_width (float): The width of the rectangle after rotation.
-        rotated_height (float): The height of the rectangle after rotation.
-        angle (float): The rotation angle in degrees.
-        current_width (float, optional): The current width, used to determine aspect ratio if provided.
-        current_height (float, optional): The current height, used to determine aspect ratio if provided.
-
-    Returns:
-        tuple[float, float]: The original width and height before rotation.
-    """
-    angle_rad = radians_angle(angle)
-
-    # Compute trigonometric values for calculations.
-    cos_angle = abs_cos(angle_rad)
-    cos_2_angle = math.cos(2 * angle_rad)
-    sin_angle = abs_sin(angle_rad)
-
-    # Determine aspect ratio from provided dimensions.
+def _aspect_ratio(current_width: Optional[float], current_height: Optional[float]) -> Optional[float]:
+    """Determine aspect ratio from provided dimensions."""
     if current_width is not None and current_height is not None and current_height != 0:
-        aspect_ratio = current_width / current_height
+        return current_width / current_height
     elif current_width is not None:
-        aspect_ratio = math.inf  # Infinite aspect ratio if only width is provided.
+        return math.inf  # Infinite aspect ratio if only width is provided.
     elif current_height is not None:
-        aspect_ratio = 0  # Zero aspect ratio if only height is provided.
+        return 0  # Zero aspect ratio if only height is provided.
     else:
-        aspect_ratio = None  # Undefined if no dimensions are provided.
-
-    # Handle cases where angle is a multiple of 90 degrees.
-    if angle % 90 == 0:
-        if angle % 180 == 0:
-            if aspect_ratio is not None:
-                if math.isinf(aspect_ratio):
-                    height = rotated_height
-                    width = current_width
-                elif aspect_ratio == 0:
-                    width = rotated_width
-                    height = current_height
-                else:
-                    width = min(rotated_width, rotated_height * aspect_ratio)
-                    height = width / aspect_ratio
-            else:
-                width, height = rotated_width, rotated_height
+        return None  # Undefined if no dimensions are provided.
+
+
+def _original_dimensions_orthogonal_180(rotated_width, rotated_height, current_width=None, current_height=None):
+    aspect_ratio = _aspect_ratio(current_width, current_height)
+    if aspect_ratio is not None:
+        if math.isinf(aspect_ratio):
+            height = rotated_height
+            width = current_width
+        elif aspect_ratio == 0:
+            width = rotated_width
+            height = current_height
         else:
-            if aspect_ratio is not None:
-                if math.isinf(aspect_ratio):
-                    height = rotated_width
-                    width = current_width
-                elif aspect_ratio == 0:
-                    width = rotated_height
-                    height = current_height
-                else:
-                    width = min(rotated_height, rotated_width * aspect_ratio)
-                    height = width / aspect_ratio
-            else:
-                width, height = rotated_height, rotated_width
+            width = min(rotated_width, rotated_height * aspect_ratio)
+            height = width / aspect_ratio
+    else:
+        width, height = rotated_width, rotated_height
+    return width, height
 
-    # Handle special case for angles like 45°, 135°, etc.
-    elif cos_2_angle == 0:
-        sqrt2_min_dim = math.sqrt(2) * min(rotated_width, rotated_height)
-        if aspect_ratio is not None:
-            if math.isinf(aspect_ratio):
-                width = current_width
-                height = sqrt2_min_dim - width
-            elif aspect_ratio == 0:
-                height = current_height
-                width = sqrt2_min_dim - height
-            else:
-                height = sqrt2_min_dim / (aspect_ratio + 1)
-                width = height * aspect_ratio
+
+def _original_dimensions_orthogonal_90(rotated_width, rotated_height, current_width=None, current_height=None):
+    aspect_ratio = _aspect_ratio(current_width, current_height)
+    if aspect_ratio is not None:
+        if math.isinf(aspect_ratio):
+            height = rotated_width
+            width = current_width
+        elif aspect_ratio == 0:
+            width = rotated_height
+            height = current_height
         else:
-            # Assume equal width and height for square-like shapes.
-            width = height = sqrt2_min_dim / 2
+            width = min(rotated_height, rotated_width * aspect_ratio)
+            height = width / aspect_ratio
+    else:
+        width, height = rotated_height, rotated_width
+    return width, height
 
-    # General case for arbitrary angles.
+
+def _original_dimensions_45(rotated_width, rotated_height, current_width=None, current_height=None):
+    aspect_ratio = _aspect_ratio(current_width, current_height)
+    sqrt2_min_dim = math.sqrt(2) * min(rotated_width, rotated_height)
+    if aspect_ratio is not None:
+        if math.isinf(aspect_ratio):
+            width = current_width
+            height = sqrt2_min_dim - width
+        elif aspect_ratio == 0:
+            height = current_height
+            width = sqrt2_min_dim - height
+        else:
+            height = sqrt2_min_dim / (aspect_ratio + 1)
+            width = height * aspect_ratio
     else:
+        # Assume equal width and height for square-like shapes.
+        width = height = sqrt2_min_dim / 2
+    return width, height
+
+
+def _original_dimensions_general(cos_angle: float, sin_angle: float, cos_2_angle: float):
+    def original_dimensions(rotated_width, rotated_height, current_width=None, current_height=None):
+        aspect_ratio = _aspect_ratio(current_width, current_height)
         if aspect_ratio is not None:
             if math.isinf(aspect_ratio):
                 width = current_width
@@ -222,7 +221,60 @@ def get_original_dimensions(
                              rotated_height / (aspect_ratio * sin_angle + cos_angle))
                 width = height * aspect_ratio
         else:
-            width = abs((rotated_width * cos_angle - rotated_height * sin_angle) / cos_2_angle)
-            height = abs(rotated_height - width * sin_angle) / cos_angle
+            width = math.fabs((rotated_width * cos_angle - rotated_height * sin_angle) / cos_2_angle)
+            height = math.fabs(rotated_height - width * sin_angle) / cos_angle
+        return width, height
 
-    return width, height
+    return original_dimensions
+
+
+@functools.lru_cache(maxsize=512)
+def specialize_original_dimensions(angle: float) -> Callable[..., Tuple[float, float]]:
+    """
+    Select the original dimensions computation for a rotation angle, so the angle branches
+    are evaluated once instead of on every call.
+
+    Parameters:
+        angle (float): The rotation angle in degrees.
+
+    Returns:
+        Callable[..., Tuple[float, float]]: A function taking ``(rotated_width, rotated_height,
+        current_width=None, current_height=None)`` and returning the original width and height.
+    """
+    cos_angle, sin_angle, cos_2_angle = get_trig_values(angle)
+
+    # Handle cases where angle is a multiple of 90 degrees.
+    if angle % 90 == 0:
+        if angle % 180 == 0:
+            return _original_dimensions_orthogonal_180
+        return _original_dimensions_orthogonal_90
+
+    # Handle special case for angles like 45°, 135°, etc.
+    elif cos_2_angle == 0:
+        return _original_dimensions_45
+
+    # General case for arbitrary angles.
+    return _original_dimensions_general(cos_angle, sin_angle, cos_2_angle)
+
+
+def get_original_dimensions(
+        rotated_width: float,
+        rotated_height: float,
+        angle: float,
+        current_width: float = None,
+        current_height: float = None
+) -> tuple[float, float]:
+    """
+    Compute the original width and height of a rectangle before rotation.
+
+    Parameters:
+        rotated_width (float): The width of the rectangle after rotation.
+        rotated_height (float): The height of the rectangle after rotation.
+        angle (float): The rotation angle in degrees.
+        current_width (float, optional): The current width, used to determine aspect ratio if provided.
+        current_height (float, optional): The current height, used to determine aspect ratio if provided.
+
+    Returns:
+        tuple[float, float]: The original width and height before rotation.
+    """
+    return specialize_original_dimensions(angle)(rotated_width, rotated_height, current_width, current_height)
@@ -0,0 +1,124 @@
+import gc
+import os
+import weakref
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+balQt = pytest.importorskip("balQt")
+
+from balQt.QtWidgets import QApplication, QSizePolicy, QTextEdit, QWidget, QHBoxLayout
+from balQt.rotated_widget import RotatedWidget
+from balQt.tools import get_policies
+
+# Rotated bounding box of a 100x60 widget for each tested angle
+ROTATED_SIZES = [(30, (117, 102)), (45, (113, 113)), (200, (114, 91))]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def fixed_text_edit() -> QTextEdit:
+    widget = QTextEdit()
+    widget.resize(100, 60)
+    widget.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+    return widget
+
+
+def resize_and_process(app, target, width, height):
+    target.resize(width, height)
+    app.processEvents()
+
+
+@pytest.mark.parametrize("angle, rotated_size", ROTATED_SIZES)
+def test_fixed_view_keeps_rotated_size_when_host_resizes(app, angle, rotated_size):
+    view = RotatedWidget(fixed_text_edit(), angle=angle)
+    host = QWidget()
+    QHBoxLayout(host).addWidget(view)
+    host.resize(300, 200)
+    host.show()
+    app.processEvents()
+
+    for width, height in [(300, 200), (500, 400)]:
+        resize_and_process(app, host, width, height)
+        assert (view.width(), view.height()) == rotated_size
+
+    host.close()
+
+
+@pytest.mark.parametrize("angle, rotated_size", ROTATED_SIZES)
+def test_fixed_view_snaps_back_when_resized_to_its_previous_size(app, angle, rotated_size):
+    view = RotatedWidget(fixed_text_edit(), angle=angle)
+    view.resize(300, 200)
+    view.show()
+    app.processEvents()
+    assert (view.width(), view.height()) == rotated_size
+
+    # The view already handled a resize to this size, then changed its own geometry
+    resize_and_process(app, view, 300, 200)
+    assert (view.width(), view.height()) == rotated_size
+
+    view.close()
+
+
+def test_expanding_view_follows_host_layout_after_resizes(app):
+    widget = QTextEdit()
+    widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+    view = RotatedWidget(widget, angle=30)
+    host = QWidget()
+    QHBoxLayout(host).addWidget(view)
+    host.show()
+
+    sizes = []
+    for width, height in [(300, 200), (500, 400), (300, 200)]:
+        resize_and_process(app, host, width, height)
+        sizes.append((view.width(), view.height()))
+    assert sizes == [(278, 178), (478, 378), (278, 178)]
+
+    host.close()
+
+
+@pytest.mark.parametrize("initial_angle, angle", [(30, 90), (270, 45), (0, 200)])
+def test_reassigning_angle_matches_a_view_built_at_that_angle(app, initial_angle, angle):
+    def hosted_view(view_angle):
+        view = RotatedWidget(fixed_text_edit(), angle=view_angle)
+        host = QWidget()
+        QHBoxLayout(host).addWidget(view)
+        host.resize(300, 200)
+        host.show()
+        app.processEvents()
+        return view, host
+
+    view, host = hosted_view(initial_angle)
+    view.angle = angle
+    resize_and_process(app, host, 310, 210)
+    expected_view, expected_host = hosted_view(angle)
+    resize_and_process(app, expected_host, 310, 210)
+
+    assert view.proxy.rotation() == angle
+    assert (view.width(), view.height()) == (expected_view.width(), expected_view.height())
+    assert get_policies(view.sizePolicy()) == get_policies(expected_view.sizePolicy())
+
+    host.close()
+    expected_host.close()
+
+
+def test_tiny_negative_angle_is_supported(app):
+    view = RotatedWidget(QTextEdit(), angle=-1e-14)
+    view.show()
+    app.processEvents()
+    view.close()
+
+
+def test_parentless_view_is_freed_without_cyclic_gc(app):
+    view = RotatedWidget(QTextEdit(), angle=30)
+    view_ref = weakref.ref(view)
+    gc.disable()
+    try:
+        del view
+        assert view_ref() is None
+    finally:
+        gc.enable()
@@ -0,0 +1,176 @@
+import itertools
+import math
+
+import pytest
+
+balQt = pytest.importorskip("balQt")
+
+from balQt.QtWidgets import QSizePolicy
+from balQt.tools import (combine_size_policies, get_quadrant_or_axis, QuadrantOrAxis, specialize_original_dimensions,
+                         _original_dimensions_orthogonal_180, _original_dimensions_orthogonal_90,
+                         _original_dimensions_45)
+
+POLICIES = [
+    QSizePolicy.Fixed,
+    QSizePolicy.Minimum,
+    QSizePolicy.MinimumExpanding,
+    QSizePolicy.Maximum,
+    QSizePolicy.Preferred,
+    QSizePolicy.Expanding,
+    QSizePolicy.Ignored
+]
+
+
+def linear_scan_combine_size_policies(horizontal_policy, vertical_policy):
+    """Reference: the original linear scan over the ordered policies."""
+    combined_policy = horizontal_policy | vertical_policy
+    for policy in POLICIES:
+        if combined_policy <= policy:
+            return policy
+    return QSizePolicy.Ignored
+
+
+@pytest.mark.parametrize("horizontal_policy, vertical_policy", list(itertools.product(POLICIES, POLICIES)))
+def test_combine_size_policies_matches_linear_scan(horizontal_policy, vertical_policy):
+    assert (combine_size_policies(horizontal_policy, vertical_policy)
+            == linear_scan_combine_size_policies(horizontal_policy, vertical_policy))
+
+
+def branch_cascade_quadrant_or_axis(angle):
+    """Reference: the original comparison cascade."""
+    normalized_angle = angle % 360
+    if normalized_angle == 0:
+        return QuadrantOrAxis.POSITIVE_X_AXIS
+    elif normalized_angle == 90:
+        return QuadrantOrAxis.POSITIVE_Y_AXIS
+    elif normalized_angle == 180:
+        return QuadrantOrAxis.NEGATIVE_X_AXIS
+    elif normalized_angle == 270:
+        return QuadrantOrAxis.NEGATIVE_Y_AXIS
+    elif normalized_angle < 90:
+        return QuadrantOrAxis.QUADRANT_1
+    elif normalized_angle < 180:
+        return QuadrantOrAxis.QUADRANT_2
+    elif normalized_angle < 270:
+        return QuadrantOrAxis.QUADRANT_3
+    else:
+        return QuadrantOrAxis.QUADRANT_4
+
+
+@pytest.mark.parametrize("angle", [0, 90, 180, 270, 360, 720, 0.0, 90.0, 45, 135, 225, 315, 12.5, 359.999,
+                                   -90, -180, -270, -360, -45, -1e-14, 1e-14, -1e-300, 89.99999999999999])
+def test_get_quadrant_or_axis_matches_branch_cascade(angle):
+    assert get_quadrant_or_axis(angle) == branch_cascade_quadrant_or_axis(angle)
+
+
+def branch_cascade_original_dimensions(rotated_width, rotated_height, angle, current_width=None, current_height=None,
+                                       cos_2_angle=None):
+    """Reference: the original get_original_dimensions, optionally forcing cos(2 * angle)."""
+    angle_rad = math.radians(angle % 360)
+    cos_angle = abs(math.cos(angle_rad))
+    if cos_2_angle is None:
+        cos_2_angle = math.cos(2 * angle_rad)
+    sin_angle = abs(math.sin(angle_rad))
+
+    if current_width is not None and current_height is not None and current_height != 0:
+        aspect_ratio = current_width / current_height
+    elif current_width is not None:
+        aspect_ratio = math.inf
+    elif current_height is not None:
+        aspect_ratio = 0
+    else:
+        aspect_ratio = None
+
+    if angle % 90 == 0:
+        if angle % 180 == 0:
+            if aspect_ratio is not None:
+                if math.isinf(aspect_ratio):
+                    height = rotated_height
+                    width = current_width
+                elif aspect_ratio == 0:
+                    width = rotated_width
+                    height = current_height
+                else:
+                    width = min(rotated_width, rotated_height * aspect_ratio)
+                    height = width / aspect_ratio
+            else:
+                width, height = rotated_width, rotated_height
+        else:
+            if aspect_ratio is not None:
+                if math.isinf(aspect_ratio):
+                    height = rotated_width
+                    width = current_width
+                elif aspect_ratio == 0:
+                    width = rotated_height
+                    height = current_height
+                else:
+                    width = min(rotated_height, rotated_width * aspect_ratio)
+                    height = width / aspect_ratio
+            else:
+                width, height = rotated_height, rotated_width
+    elif cos_2_angle == 0:
+        sqrt2_min_dim = math.sqrt(2) * min(rotated_width, rotated_height)
+        if aspect_ratio is not None:
+            if math.isinf(aspect_ratio):
+                width = current_width
+                height = sqrt2_min_dim - width
+            elif aspect_ratio == 0:
+                height = current_height
+                width = sqrt2_min_dim - height
+            else:
+                height = sqrt2_min_dim / (aspect_ratio + 1)
+                width = height * aspect_ratio
+        else:
+            width = height = sqrt2_min_dim / 2
+    else:
+        if aspect_ratio is not None:
+            if math.isinf(aspect_ratio):
+                width = current_width
+                height = min((rotated_width - width * cos_angle) / sin_angle,
+                             (rotated_height - width * sin_angle) / cos_angle)
+            elif aspect_ratio == 0:
+                height = current_height
+                width = min((rotated_width - height * sin_angle) / cos_angle,
+                            (rotated_height - height * cos_angle) / sin_angle)
+            else:
+                height = min(rotated_width / (aspect_ratio * cos_angle + sin_angle),
+                             rotated_height / (aspect_ratio * sin_angle + cos_angle))
+                width = height * aspect_ratio
+        else:
+            width = abs((rotated_width * cos_angle - rotated_height * sin_angle) / cos_2_angle)
+            height = abs(rotated_height - width * sin_angle) / cos_angle
+
+    return width, height
+
+
+# Current dimensions covering each aspect ratio case: None, inf, 0 and finite
+CURRENT_DIMENSIONS = [(None, None), (40, None), (40, 0), (None, 40), (0, 40), (40, 20), (20, 40)]
+ROTATED_DIMENSIONS = [(300, 200), (200, 300), (150, 150)]
+
+
+@pytest.mark.parametrize("angle, specialization", [
+    (0, _original_dimensions_orthogonal_180), (180, _original_dimensions_orthogonal_180),
+    (-180, _original_dimensions_orthogonal_180), (360, _original_dimensions_orthogonal_180),
+    (90, _original_dimensions_orthogonal_90), (270, _original_dimensions_orthogonal_90),
+    (-90, _original_dimensions_orthogonal_90),
+    (30, None), (45, None), (100, None), (200, None), (315, None), (-30, None), (12.5, None)
+])
+@pytest.mark.parametrize("current_width, current_height", CURRENT_DIMENSIONS)
+@pytest.mark.parametrize("rotated_width, rotated_height", ROTATED_DIMENSIONS)
+def test_specialized_original_dimensions_match_branch_cascade(angle, specialization, current_width, current_height,
+                                                              rotated_width, rotated_height):
+    original_dimensions = specialize_original_dimensions(angle)
+    if specialization is not None:
+        assert original_dimensions is specialization
+    assert (original_dimensions(rotated_width, rotated_height, current_width, current_height)
+            == branch_cascade_original_dimensions(rotated_width, rotated_height, angle,
+                                                  current_width, current_height))
+
+
+@pytest.mark.parametrize("current_width, current_height", CURRENT_DIMENSIONS)
+@pytest.mark.parametrize("rotated_width, rotated_height", ROTATED_DIMENSIONS)
+def test_original_dimensions_45_matches_branch_cascade(current_width, current_height, rotated_width, rotated_height):
+    # Floating point never yields cos(2 * angle) == 0 exactly, so exercise that branch directly
+    assert (_original_dimensions_45(rotated_width, rotated_height, current_width, current_height)
+            == branch_cascade_original_dimensions(rotated_width, rotated_height, 45, current_width, current_height,
+                                                  cos_2_angle=0))